@@ -14,25 +14,33 @@ from dotenv import load_dotenv
 # Add src directory to path to import migrator
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 from weaviate_to_zilliz_migrator import WeaviateToZillizMigrator
+from utils import create_buffered_file_handler
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-os.makedirs('logs', exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'logs/load_collections_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
+def setup_logging():
+    """Log to stdout and a timestamped file, replacing any handlers configured earlier"""
+    os.makedirs('logs', exist_ok=True)
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(
+        level=logging.INFO,
+        format=log_format,
+        handlers=[
+            create_buffered_file_handler(f'logs/load_collections_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', log_format),
+            logging.StreamHandler(sys.stdout)
+        ],
+        force=True
+    )
+
+
 def main():
     """Main entry point for loading all collections"""
+    setup_logging()
+    
     logger.info("Starting load all collections process")
     
     # Validate required environment variables
@@ -40,7 +48,7 @@ def main():
     missing_vars = [var for var in required_vars if not os.getenv(var)]
     
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        logger.error("Missing required environment variables: %s", ', '.join(missing_vars))
         logger.error("Please set these variables in your .env file or environment")
         sys.exit(1)
     
@@ -60,7 +68,7 @@ def main():
         logger.info("Process interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Process failed: {str(e)}")
+        logger.error("Process failed: %s", e)
         sys.exit(1)
 
 
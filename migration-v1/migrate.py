@@ -8,29 +8,38 @@ import os
 import argparse
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from weaviate_to_zilliz_migrator import WeaviateToZillizMigrator
+# The migrator, its client libraries and numpy are imported lazily so that
+# --help and argument errors return without paying their import cost.
 from config import MigrationConfig
 
+if TYPE_CHECKING:
+    from weaviate_to_zilliz_migrator import WeaviateToZillizMigrator
+
 logger = logging.getLogger(__name__)
 
 
 def setup_logging(log_level: str = 'INFO'):
     """Setup logging configuration"""
+    from utils import create_buffered_file_handler
+
     # Create logs directory
     os.makedirs('logs', exist_ok=True)
     
-    # Configure logging with proper file handler management
-    file_handler = logging.FileHandler('logs/migration.log')
+    # Configure logging with proper file handler management; file writes are batched
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    file_handler = create_buffered_file_handler('logs/migration.log', log_format)
     stream_handler = logging.StreamHandler(sys.stdout)
     
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[file_handler, stream_handler]
+        format=log_format,
+        handlers=[file_handler, stream_handler],
+        force=True  # Replace, rather than add to, any handlers configured earlier
     )
 
 
@@ -73,6 +82,12 @@ Examples:
         help='Override batch size for migration'
     )
     
+    parser.add_argument(
+        '--max-collection-workers',
+        type=int,
+        help='Number of collections to migrate in parallel (default: MAX_COLLECTION_WORKERS or 3)'
+    )
+    
     parser.add_argument(
         '--skip-verification',
         action='store_true',
@@ -95,16 +110,18 @@ def validate_environment():
         config.validate()
         return config
     except Exception as e:
-        logger.error(f"Configuration validation failed: {str(e)}")
+        logger.error("Configuration validation failed: %s", e)
         logger.error("Please check your environment variables or .env file")
         return None
 
 
-def preview_migration(migrator: WeaviateToZillizMigrator, collections: list = None):
+def preview_migration(migrator: 'WeaviateToZillizMigrator', collections: list = None):
     """Preview migration plan without executing"""
-    logger.info("="*60)
+    from utils import SEPARATOR
+
+    logger.info(SEPARATOR)
     logger.info("MIGRATION PREVIEW")
-    logger.info("="*60)
+    logger.info(SEPARATOR)
     
     try:
         # Connect to Weaviate only
@@ -146,18 +163,17 @@ def preview_migration(migrator: WeaviateToZillizMigrator, collections: list = No
             # Get document count
             data = migrator.get_collection_data(collection, limit=1)
             if data:
-                # Get actual count by querying without limit
-                all_data = migrator.get_collection_data(collection)
-                logger.info(f"  Documents: {len(all_data)}")
+                # Get actual count from an aggregate query instead of reading every object
+                logger.info(f"  Documents: {migrator.get_weaviate_count(collection)}")
                 
                 # Get vector dimension
                 vector = data[0]['_additional'].get('vector')
-                if vector:
+                if vector is not None and len(vector):
                     logger.info(f"  Vector dimension: {len(vector)}")
             else:
                 logger.info(f"  Documents: 0")
                 
-        logger.info("\n" + "="*60)
+        logger.info("\n" + SEPARATOR)
         logger.info("Preview completed. Use --dry-run=false to execute migration.")
         
     except Exception as e:
@@ -172,7 +188,7 @@ def main():
     setup_logging(args.log_level)
     
     logger.info("Starting Weaviate to Zilliz Cloud Migration Tool")
-    logger.info(f"Arguments: {vars(args)}")
+    logger.info("Arguments: %s", vars(args))
     
     # Validate configuration
     config = validate_environment()
@@ -180,12 +196,18 @@ def main():
         sys.exit(1)
         
     # Create migrator
+    from weaviate_to_zilliz_migrator import WeaviateToZillizMigrator
     migrator = WeaviateToZillizMigrator()
     
     # Override batch size if specified
     if args.batch_size:
         migrator.batch_size = args.batch_size
-        logger.info(f"Using custom batch size: {args.batch_size}")
+        logger.info("Using custom batch size: %d", args.batch_size)
+        
+    # Override collection parallelism if specified
+    if args.max_collection_workers:
+        migrator.max_collection_workers = args.max_collection_workers
+        logger.info("Using %d collection workers", args.max_collection_workers)
         
     try:
         if args.dry_run:
@@ -204,7 +226,7 @@ def main():
         logger.info("Migration interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Migration failed: {str(e)}")
+        logger.error("Migration failed: %s", e)
         logger.debug("Full error details:", exc_info=True)
         sys.exit(1)
 
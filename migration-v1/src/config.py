@@ -3,6 +3,7 @@ Configuration management for Weaviate to Zilliz migration
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from dotenv import load_dotenv
 
@@ -36,6 +37,15 @@ class MigrationConfig:
             'efConstruction': int(os.getenv('ZILLIZ_INDEX_EF_CONSTRUCTION', '64'))
         }
         
+    @classmethod
+    @lru_cache(maxsize=None)
+    def load(cls) -> 'MigrationConfig':
+        """Return a configuration read from the environment once per process
+        
+        Call MigrationConfig.load.cache_clear() to pick up environment changes.
+        """
+        return cls()
+        
     def validate(self) -> bool:
         """Validate configuration settings"""
         required_fields = [
@@ -2,20 +2,25 @@
 Data transformation utilities for Weaviate to Zilliz migration
 """
 
-import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
 from pymilvus import DataType, FieldSchema
 from utils import (
     validate_vector, 
     sanitize_field_name, 
     truncate_text, 
     extract_text_content,
-    safe_json_serialize
+    safe_json_serialize,
+    estimate_row_bytes,
+    TEXT_CONTENT_FIELDS
 )
 
 logger = logging.getLogger(__name__)
 
+# Weaviate data types that GraphQL can only return with a nested selection
+_NESTED_DATA_TYPES = {'geocoordinates', 'phonenumber', 'object', 'object[]'}
+
 
 class DataTransformer:
     """Handles data transformation between Weaviate and Zilliz formats"""
@@ -33,6 +38,8 @@ class DataTransformer:
             'boolean': DataType.BOOL,
             'bool': DataType.BOOL
         }
+        # Collections already warned about properties left out by the whitelist
+        self._whitelist_warned = set()
         
     def analyze_weaviate_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze Weaviate schema to determine field types and mappings"""
@@ -88,6 +95,48 @@ class DataTransformer:
         elif primary_type in ['boolean', 'bool']:
             analysis['boolean_properties'].append(prop_name)
         
+    def get_source_properties(self, schema: Dict[str, Any], wanted: Optional[List[str]] = None) -> List[str]:
+        """Names of the Weaviate properties the transform consumes, optionally limited to a whitelist
+        
+        Cross-references and nested types are left out: they cannot be selected without a
+        sub-selection and have no place in the Dify metadata. The text fields page_content is
+        built from are always kept; other properties outside the whitelist are left out of the
+        metadata, which is logged once per collection.
+        """
+        if not schema or 'properties' not in schema:
+            return []
+            
+        properties = schema['properties']
+        if isinstance(properties, dict):
+            items = properties.items()
+        elif isinstance(properties, list):
+            items = ((prop.get('name'), prop) for prop in properties)
+        else:
+            return []
+            
+        wanted_set = set(wanted) | set(TEXT_CONTENT_FIELDS) if wanted else None
+        needed = []
+        dropped = []
+        for prop_name, prop_info in items:
+            if not prop_name:
+                continue
+            if wanted_set is not None and prop_name not in wanted_set:
+                dropped.append(prop_name)
+                continue
+            data_types = (prop_info or {}).get('dataType') or ['text']
+            primary_type = data_types[0]
+            # Reference properties use the target class name (capitalized) as their data type
+            if primary_type[:1].isupper() or primary_type.lower() in _NESTED_DATA_TYPES:
+                continue
+            needed.append(prop_name)
+            
+        class_name = schema.get('class')
+        if dropped and class_name not in self._whitelist_warned:
+            self._whitelist_warned.add(class_name)
+            logger.warning("MIGRATION_PROPERTIES excludes %d properties of %s from the metadata: %s",
+                           len(dropped), class_name, ', '.join(dropped))
+        return needed
+        
     def create_zilliz_schema_fields(self, weaviate_schema: Dict[str, Any], vector_dim: int) -> List[FieldSchema]:
         """Create Zilliz schema fields compatible with Dify structure"""
         fields = []
@@ -116,8 +165,8 @@ class DataTransformer:
                 logger.warning("Document missing ID, skipping")
                 return None
                 
-            if not vector or not validate_vector(vector):
-                logger.warning(f"Document {doc_id} has invalid vector, skipping")
+            if vector is None or not validate_vector(vector):
+                logger.warning("Document %s has invalid vector, skipping", doc_id)
                 return None
                 
             # Extract properties (everything except _additional)
@@ -145,7 +194,7 @@ class DataTransformer:
             
         except Exception as e:
             doc_id = weaviate_doc.get('_additional', {}).get('id', 'unknown')
-            logger.error(f"Failed to transform document {doc_id}: {str(e)}")
+            logger.error("Failed to transform document %s: %s", doc_id, e)
             return None
             
     def _transform_field_value(self, value: Any, target_type: DataType) -> Any:
@@ -170,7 +219,7 @@ class DataTransformer:
                 return str(value)
                 
         except (ValueError, TypeError) as e:
-            logger.warning(f"Failed to transform value {value} to {target_type}: {str(e)}")
+            logger.warning("Failed to transform value %s to %s: %s", value, target_type, e)
             return None
             
     def transform_batch(self, weaviate_batch: List[Dict[str, Any]], schema_analysis: Dict[str, Any] = None) -> List[Dict[str, Any]]:
@@ -182,11 +231,36 @@ class DataTransformer:
             if transformed:
                 transformed_docs.append(transformed)
                 
-        logger.debug(f"Transformed {len(transformed_docs)}/{len(weaviate_batch)} documents")
+        self._pack_vectors(transformed_docs)
+        
+        logger.debug("Transformed %d/%d documents", len(transformed_docs), len(weaviate_batch))
         return transformed_docs
         
-    def validate_transformed_data(self, zilliz_docs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
-        """Validate transformed data and return valid documents and error messages"""
+    def _pack_vectors(self, zilliz_docs: List[Dict[str, Any]]):
+        """Pack the batch's vectors into one contiguous float32 matrix, one row view per document"""
+        if not zilliz_docs:
+            return
+            
+        try:
+            vectors = np.asarray([doc['vector'] for doc in zilliz_docs], dtype=np.float32)
+        except ValueError:
+            # Mixed dimensions can't form a matrix, keep the original lists
+            logger.warning("Batch contains vectors of different dimensions, skipping float32 packing")
+            return
+            
+        if vectors.ndim != 2:
+            return
+            
+        for doc, row in zip(zilliz_docs, vectors):
+            doc['vector'] = row
+            
+    def validate_transformed_data(self, zilliz_docs: List[Dict[str, Any]],
+                                  row_bytes: Optional[List[int]] = None) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Validate transformed data and return valid documents and error messages
+        
+        If row_bytes is given, the estimated insert size of each valid document is appended to it,
+        reusing the metadata serialization done for validation.
+        """
         valid_docs = []
         errors = []
         
@@ -215,12 +289,14 @@ class DataTransformer:
                     
                 # Validate metadata is JSON serializable
                 try:
-                    safe_json_serialize(doc['metadata'])
+                    metadata_json = safe_json_serialize(doc['metadata'])
                 except Exception:
                     errors.append(f"Document {i}: Metadata not JSON serializable")
                     continue
                     
                 valid_docs.append(doc)
+                if row_bytes is not None:
+                    row_bytes.append(estimate_row_bytes(doc, metadata_json))
                 
             except Exception as e:
                 errors.append(f"Document {i}: Validation error: {str(e)}")
@@ -259,7 +335,7 @@ class DataTransformer:
                     
             # Analyze vector dimensions
             vector = doc.get('_additional', {}).get('vector')
-            if vector:
+            if vector is not None and len(vector):
                 stats['vector_dimensions'].add(len(vector))
                 
         stats['vector_dimensions'] = list(stats['vector_dimensions'])
@@ -4,13 +4,20 @@ Utility functions for Weaviate to Zilliz migration
 
 import json
 import logging
+import logging.handlers
 import time
 from typing import Any, Dict, List, Optional
-from functools import wraps
+from functools import lru_cache, wraps
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Separator line for console banners
+SEPARATOR = "=" * 60
+
+# Properties tried, in order, for a document's page_content
+TEXT_CONTENT_FIELDS = ['content', 'text', 'title', 'description', 'body', 'summary']
+
 
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0):
     """Decorator for retrying failed operations"""
@@ -37,21 +44,27 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float =
 
 
 def validate_vector(vector: List[float]) -> bool:
-    """Validate vector data"""
+    """Validate vector data (a list of numbers or a 1-D numpy array)"""
+    if isinstance(vector, np.ndarray):
+        return vector.ndim == 1 and vector.size > 0 and bool(np.isfinite(vector).all())
+        
     if not vector:
         return False
         
     if not isinstance(vector, list):
         return False
         
-    if not all(isinstance(x, (int, float)) for x in vector):
+    # Convert once and check the whole vector in C instead of per element
+    try:
+        vector_array = np.asarray(vector)
+    except (TypeError, ValueError):
         return False
         
-    # Check for NaN or infinite values
-    if any(np.isnan(x) or np.isinf(x) for x in vector):
+    if vector_array.ndim != 1 or vector_array.dtype.kind not in 'biuf':
         return False
         
-    return True
+    # Check for NaN or infinite values
+    return bool(np.isfinite(vector_array).all())
 
 
 def normalize_vector(vector: List[float]) -> List[float]:
@@ -98,7 +111,7 @@ def truncate_text(text: str, max_length: int = 65534) -> str:
 def extract_text_content(properties: Dict[str, Any], text_fields: List[str] = None) -> str:
     """Extract text content from properties"""
     if text_fields is None:
-        text_fields = ['content', 'text', 'title', 'description', 'body', 'summary']
+        text_fields = TEXT_CONTENT_FIELDS
         
     # Try predefined text fields first
     for field in text_fields:
@@ -184,8 +197,9 @@ def validate_collection_name(name: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=None)
 def create_safe_collection_name(original_name: str) -> str:
-    """Create a safe collection name for Zilliz"""
+    """Create a safe collection name for Zilliz (deterministic, so memoized)"""
     if validate_collection_name(original_name):
         return original_name
         
@@ -223,10 +237,62 @@ def chunk_list(lst: List[Any], chunk_size: int):
         yield lst[i:i + chunk_size]
 
 
+def chunk_list_by_size(lst: List[Any], sizes: List[int], max_bytes: int, max_items: int):
+    """Split list into chunks whose summed sizes stay within max_bytes (and at most max_items long)"""
+    start = 0
+    total = 0
+    for i, size in enumerate(sizes):
+        if i > start and (total + size > max_bytes or i - start >= max_items):
+            yield lst[start:i]
+            start = i
+            total = 0
+        total += size
+    if start < len(lst):
+        yield lst[start:]
+
+
+def estimate_row_bytes(row: Dict[str, Any], metadata_json: Optional[str] = None) -> int:
+    """Approximate insert size of a Zilliz row: float32 vector, UTF-8 id and text,
+    serialized metadata and ~256 bytes of per-field framing"""
+    if metadata_json is None:
+        metadata_json = safe_json_serialize(row.get('metadata') or {})
+    return (len(row['vector']) * 4 + len(row['id'].encode()) + len(row['page_content'].encode())
+            + len(metadata_json.encode()) + 256)
+
+
 def safe_json_serialize(obj: Any) -> str:
     """Safely serialize object to JSON"""
     try:
         return json.dumps(obj, ensure_ascii=False, default=str)
     except Exception as e:
         logger.warning(f"Failed to serialize object: {str(e)}")
-        return str(obj)
\ No newline at end of file
+        return str(obj)
+
+
+class IntervalMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes on the first record arriving flush_interval seconds after the last flush"""
+    
+    def __init__(self, capacity: int, flushLevel: int = logging.WARNING, target: logging.Handler = None,
+                 flush_interval: float = 5.0):
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return super().shouldFlush(record) or time.monotonic() - self._last_flush >= self.flush_interval
+        
+    def flush(self):
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+def create_buffered_file_handler(filename: str, fmt: str, capacity: int = 1024,
+                                 flush_interval: float = 5.0) -> logging.Handler:
+    """Create a log file handler that writes records in batches
+    
+    Records are buffered until capacity is reached, a WARNING or higher arrives or flush_interval
+    seconds have passed; logging's shutdown hook flushes the remainder at exit.
+    """
+    file_handler = logging.FileHandler(filename, delay=True)
+    file_handler.setFormatter(logging.Formatter(fmt))
+    return IntervalMemoryHandler(capacity, target=file_handler, flush_interval=flush_interval)
@@ -4,16 +4,15 @@ Connection test script - Verify connections to Weaviate and Zilliz Cloud using v
 """
 
 import sys
-import os
 from pathlib import Path
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from config import MigrationConfig
-import weaviate
-from pymilvus import MilvusClient
+from utils import SEPARATOR
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -29,7 +28,9 @@ def test_weaviate_connection():
     logger.info("Testing Weaviate connection (v3 client)...")
     
     try:
-        config = MigrationConfig()
+        import weaviate
+        
+        config = MigrationConfig.load()
         
         # Configure authentication for v3 client
         if config.weaviate_api_key:
@@ -51,12 +52,12 @@ def test_weaviate_connection():
             
             # Get Weaviate version info
             meta = client.get_meta()
-            logger.info(f"✓ Weaviate version: {meta.get('version', 'unknown')}")
+            logger.info("✓ Weaviate version: %s", meta.get('version', 'unknown'))
             
             # Get collections using v3 client
             schema = client.schema.get()
             collections = [cls['class'] for cls in schema.get('classes', [])]
-            logger.info(f"✓ Found {len(collections)} collections: {collections}")
+            logger.info("✓ Found %d collections: %s", len(collections), collections)
             
             return True
         else:
@@ -73,7 +74,9 @@ def test_zilliz_connection():
     logger.info("Testing Zilliz Cloud connection...")
     
     try:
-        config = MigrationConfig()
+        from pymilvus import MilvusClient
+        
+        config = MigrationConfig.load()
         
         # Create Zilliz client
         client = MilvusClient(
@@ -85,7 +88,7 @@ def test_zilliz_connection():
         # Test connection by listing collections
         collections = client.list_collections()
         logger.info("✓ Zilliz Cloud connection successful")
-        logger.info(f"✓ Found {len(collections)} collections: {collections}")
+        logger.info("✓ Found %d collections: %s", len(collections), collections)
         
         return True
         
@@ -99,19 +102,19 @@ def test_configuration():
     logger.info("Testing configuration...")
     
     try:
-        config = MigrationConfig()
+        config = MigrationConfig.load()
         config.validate()
         logger.info("✓ Configuration validation successful")
         
         # Print configuration summary
         config_dict = config.to_dict()
         logger.info("Configuration summary:")
-        logger.info(f"  Weaviate endpoint: {config_dict['weaviate']['endpoint']}")
-        logger.info(f"  Weaviate has API key: {config_dict['weaviate']['has_api_key']}")
-        logger.info(f"  Zilliz URI: {config_dict['zilliz']['uri']}")
-        logger.info(f"  Zilliz database: {config_dict['zilliz']['database']}")
-        logger.info(f"  Zilliz has token: {config_dict['zilliz']['has_token']}")
-        logger.info(f"  Batch size: {config_dict['migration']['batch_size']}")
+        logger.info("  Weaviate endpoint: %s", config_dict['weaviate']['endpoint'])
+        logger.info("  Weaviate has API key: %s", config_dict['weaviate']['has_api_key'])
+        logger.info("  Zilliz URI: %s", config_dict['zilliz']['uri'])
+        logger.info("  Zilliz database: %s", config_dict['zilliz']['database'])
+        logger.info("  Zilliz has token: %s", config_dict['zilliz']['has_token'])
+        logger.info("  Batch size: %s", config_dict['migration']['batch_size'])
         
         return True
         
@@ -122,23 +125,27 @@ def test_configuration():
 
 def main():
     """Main test function"""
-    logger.info("="*60)
+    logger.info(SEPARATOR)
     logger.info("CONNECTION TEST SUITE (Weaviate v3 Client)")
-    logger.info("="*60)
+    logger.info(SEPARATOR)
     
-    results = {
-        'configuration': test_configuration(),
-        'weaviate': test_weaviate_connection(),
-        'zilliz': test_zilliz_connection()
-    }
+    # The probes are independent, so run them concurrently; they share one cached config
+    probes = [
+        ('configuration', test_configuration),
+        ('weaviate', test_weaviate_connection),
+        ('zilliz', test_zilliz_connection)
+    ]
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {name: executor.submit(probe) for name, probe in probes}
+        results = {name: future.result() for name, future in futures.items()}
     
-    logger.info("\n" + "="*60)
+    logger.info("\n" + SEPARATOR)
     logger.info("TEST RESULTS SUMMARY")
-    logger.info("="*60)
+    logger.info(SEPARATOR)
     
     for test_name, result in results.items():
         status = "✓ PASS" if result else "✗ FAIL"
-        logger.info(f"{test_name.capitalize()}: {status}")
+        logger.info("%s: %s", test_name.capitalize(), status)
         
     all_passed = all(results.values())
     
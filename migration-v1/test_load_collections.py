@@ -10,7 +10,6 @@ from dotenv import load_dotenv
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-from weaviate_to_zilliz_migrator import WeaviateToZillizMigrator
 
 # Load environment variables
 load_dotenv()
@@ -19,15 +18,29 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One connected migrator shared by all tests, so Zilliz is only connected to once
+_migrator = None
+
+
+def get_migrator():
+    """Return the shared migrator, connecting to Zilliz Cloud on first use"""
+    global _migrator
+    if _migrator is None:
+        # Imported here so loading this module doesn't pull in weaviate and pymilvus
+        from weaviate_to_zilliz_migrator import WeaviateToZillizMigrator
+        
+        migrator = WeaviateToZillizMigrator()
+        migrator.connect_zilliz()
+        _migrator = migrator
+    return _migrator
+
 
 def test_get_collections():
     """Test getting collections from Zilliz Cloud"""
     logger.info("Testing get_zilliz_collections method...")
     
-    migrator = WeaviateToZillizMigrator()
-    
     try:
-        migrator.connect_zilliz()
+        migrator = get_migrator()
         collections = migrator.get_zilliz_collections()
         
         logger.info(f"Found collections: {collections}")
@@ -44,10 +57,8 @@ def test_load_single_collection(collection_name: str):
     """Test loading a single collection"""
     logger.info(f"Testing load_collection method for: {collection_name}")
     
-    migrator = WeaviateToZillizMigrator()
-    
     try:
-        migrator.connect_zilliz()
+        migrator = get_migrator()
         migrator.load_collection(collection_name)
         logger.info(f"Successfully tested loading collection: {collection_name}")
         
@@ -59,10 +70,8 @@ def test_load_all_collections():
     """Test loading all collections"""
     logger.info("Testing load_all_collections method...")
     
-    migrator = WeaviateToZillizMigrator()
-    
     try:
-        migrator.connect_zilliz()
+        migrator = get_migrator()
         migrator.load_all_collections()
         logger.info("Successfully tested load_all_collections")
         
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+import threading
+import uuid
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from unittest.mock import Mock
+from weaviate_to_zilliz_migrator import WeaviateToZillizMigrator
+
+
+class FakeQuery:
+    """Minimal v3 GetBuilder serving objects in id order through the cursor API"""
+
+    def __init__(self, collection_name, objects):
+        self.collection_name = collection_name
+        self.objects = objects
+        self.limit = None
+        self.after = None
+
+    def with_additional(self, fields):
+        return self
+
+    def with_limit(self, limit):
+        self.limit = limit
+        return self
+
+    def with_after(self, after):
+        self.after = after
+        return self
+
+    def do(self):
+        page = [obj for obj in self.objects if self.after is None or obj['_additional']['id'] > self.after]
+        page = [{'text': obj['text'], '_additional': dict(obj['_additional'])} for obj in page[:self.limit]]
+        return {'data': {'Get': {self.collection_name: page}}}
+
+
+class FakeZilliz:
+    """Zilliz client recording rows; insert appends like Milvus, upsert replaces by id"""
+
+    def __init__(self, fail_on_insert=None):
+        self.rows = []
+        self.calls = 0
+        self.fail_on_insert = fail_on_insert
+        self.lock = threading.Lock()
+
+    def insert(self, collection_name, data):
+        with self.lock:
+            self.calls += 1
+            if self.calls == self.fail_on_insert:
+                raise Exception("Insert rejected")
+            self.rows.extend(data)
+
+    def upsert(self, collection_name, data):
+        with self.lock:
+            ids = {row['id'] for row in data}
+            self.rows = [row for row in self.rows if row['id'] not in ids] + list(data)
+
+
+def make_migrator(objects, zilliz):
+    """Build a migrator wired to fake Weaviate and Zilliz clients"""
+    migrator = WeaviateToZillizMigrator()
+    migrator.batch_size = 50
+    migrator.weaviate_client = Mock()
+    migrator.weaviate_client.query.get.side_effect = lambda name, properties: FakeQuery(name, objects)
+    migrator.weaviate_client.schema.get.return_value = {
+        'class': 'Docs', 'properties': [{'name': 'text', 'dataType': ['text']}]
+    }
+    migrator.zilliz_client = Mock()
+    migrator.zilliz_client.has_collection.return_value = False
+    migrator.zilliz_client.list_indexes.return_value = []
+    migrator.get_thread_safe_zilliz_client = lambda: zilliz
+    migrator.create_zilliz_collection_no_index = Mock(return_value=True)
+    migrator.finalize_zilliz_collection = Mock()
+    return migrator
+
+
+def make_objects(count):
+    """Source objects with random ids, sorted the way the cursor API returns them"""
+    ids = sorted(str(uuid.uuid4()) for _ in range(count))
+    return [{'text': f'document {i}', '_additional': {'id': doc_id, 'vector': [0.1, 0.2, 0.3]}}
+            for i, doc_id in enumerate(ids)]
+
+
+def resume_after_failure(objects, zilliz, break_first_run):
+    """Run a migration that fails part-way, then resume it; returns the resumed run's count"""
+    migrator = make_migrator(objects, zilliz)
+    break_first_run(migrator)
+    try:
+        migrator.migrate_collection('Docs')
+    except Exception:
+        pass
+    else:
+        assert False, "Should fail the collection on the first failed batch"
+    assert os.path.exists(migrator._checkpoint_path('Docs')), "Should keep the checkpoint for a resume"
+    assert not migrator.finalize_zilliz_collection.called, "Should not index a partial collection"
+    migrator._shutdown_insert_pool()
+
+    # The collection now exists, so only the checkpoint lets the second run continue
+    migrator = make_migrator(objects, zilliz)
+    migrator.zilliz_client.has_collection.return_value = True
+    migrator.create_zilliz_collection_no_index.return_value = False
+    migrated, skipped = migrator.migrate_collection('Docs')
+    assert not skipped, "Should resume rather than skip a collection with a checkpoint"
+    assert not os.path.exists(migrator._checkpoint_path('Docs')), "Should clear the checkpoint when done"
+    assert migrator.finalize_zilliz_collection.call_count == 1, "Should index once the copy is complete"
+    migrator._shutdown_insert_pool()
+    return migrated
+
+
+def test_resume_migration():
+    """Resumed migrations neither duplicate nor lose rows"""
+
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            objects = make_objects(2000)
+            source_ids = {obj['_additional']['id'] for obj in objects}
+
+            # Test case 1: A failed insert stops the collection and the resumed run upserts
+            zilliz = FakeZilliz(fail_on_insert=2)
+            resume_after_failure(objects, zilliz, lambda migrator: None)
+            assert len(zilliz.rows) == 2000, "Should not duplicate rows inserted past the checkpoint"
+            assert {row['id'] for row in zilliz.rows} == source_ids, "Should migrate every document"
+
+            # Test case 2: A failed transform stops the collection instead of skipping the batch
+            zilliz = FakeZilliz()
+
+            def break_transform(migrator):
+                transform = migrator.transform_data_for_zilliz
+                calls = []
+
+                def flaky_transform(batch, schema, row_bytes=None):
+                    calls.append(1)
+                    if len(calls) == 3:
+                        raise ValueError("Bad batch")
+                    return transform(batch, schema, row_bytes)
+                migrator.transform_data_for_zilliz = flaky_transform
+
+            resume_after_failure(objects, zilliz, break_transform)
+            assert len(zilliz.rows) == 2000, "Should not duplicate rows after a failed transform"
+            assert {row['id'] for row in zilliz.rows} == source_ids, "Should not lose the failed batch"
+
+            # Test case 3: A failed sharded scan is redone from the start instead of being skipped
+            zilliz = FakeZilliz(fail_on_insert=2)
+
+            def shard_scan(migrator):
+                migrator.fetch_shards = 4
+
+            resume_after_failure(objects, zilliz, shard_scan)
+            assert len(zilliz.rows) == 2000, "Should not duplicate rows after a failed sharded scan"
+            assert {row['id'] for row in zilliz.rows} == source_ids, "Should finish a failed sharded scan"
+
+            # Test case 4: A checkpoint is ignored when the target collection had to be created again
+            zilliz = FakeZilliz()
+            migrator = make_migrator(objects, zilliz)
+            migrator._save_checkpoint('Docs', objects[999]['_additional']['id'], 1000, 1000, 20)
+            migrated, skipped = migrator.migrate_collection('Docs')
+            migrator._shutdown_insert_pool()
+            assert migrated == 2000 and len(zilliz.rows) == 2000, "Should restart when the collection is new"
+
+            # Test case 5: Checkpoints are kept apart per Zilliz cluster and database
+            other = make_migrator(objects, FakeZilliz())
+            other.zilliz_db_name = 'other_db'
+            assert other._checkpoint_path('Docs') != migrator._checkpoint_path('Docs'), "Should key by target"
+
+            # Test case 6: A sharded scan reads every object exactly once and leaves no checkpoint
+            zilliz = FakeZilliz()
+            migrator = make_migrator(objects, zilliz)
+            migrator.fetch_shards = 4
+            migrated, skipped = migrator.migrate_collection('Docs')
+            migrator._shutdown_insert_pool()
+            assert migrated == 2000 and len(zilliz.rows) == 2000, "Should migrate every object once"
+            assert {row['id'] for row in zilliz.rows} == source_ids, "Should cover every shard"
+            assert not os.path.exists(migrator._checkpoint_path('Docs')), "Should clear the checkpoint of a finished sharded scan"
+        finally:
+            os.chdir(cwd)
+
+    print("All tests passed!")
+
+
+if __name__ == "__main__":
+    test_resume_migration()
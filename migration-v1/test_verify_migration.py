@@ -15,7 +15,7 @@ def test_verify_migration():
     migrator = WeaviateToZillizMigrator()
     
     # Mock the dependencies
-    migrator.get_collection_data = Mock(return_value=[{'id': 1}, {'id': 2}, {'id': 3}])
+    migrator.get_weaviate_count = Mock(return_value=3)
     migrator.zilliz_client = Mock()
     migrator.zilliz_client.get_collection_stats = Mock(return_value={'rowCount': 3})
     
@@ -23,9 +23,9 @@ def test_verify_migration():
     result = migrator.verify_migration('test_collection')
     assert result == True, "Should return True when counts match"
     
-    # Test case 2: Fallback to query when get_collection_stats fails
+    # Test case 2: Fallback to a count(*) query when get_collection_stats fails
     migrator.zilliz_client.get_collection_stats.side_effect = Exception("Stats not available")
-    migrator.zilliz_client.query = Mock(return_value=[{'id': 1}, {'id': 2}, {'id': 3}])
+    migrator.zilliz_client.query = Mock(return_value=[{'count(*)': 3}])
     
     result = migrator.verify_migration('test_collection')
     assert result == True, "Should return True when fallback query works"
@@ -36,12 +36,28 @@ def test_verify_migration():
     result = migrator.verify_migration('test_collection')
     assert result == True, "Should handle None query result"
     
-    # Test case 4: Handle exception in get_collection_data
-    migrator.get_collection_data.side_effect = Exception("Connection error")
+    # Test case 4: Handle exception in get_weaviate_count
+    migrator.get_weaviate_count.side_effect = Exception("Connection error")
     
     result = migrator.verify_migration('test_collection')
     assert result == False, "Should return False when exception occurs"
     
+    # Test case 5: Known Weaviate count skips re-reading the collection
+    migrator.zilliz_client.get_collection_stats = Mock(return_value={'rowCount': 3})
+    
+    result = migrator.verify_migration('test_collection', weaviate_count=3)
+    assert result == True, "Should not read Weaviate data when the count is passed in"
+    
+    # Test case 6: Zilliz count matching the migrated count skips the Weaviate side entirely
+    result = migrator.verify_migration('test_collection', weaviate_count=3, expected=3)
+    assert result == True, "Should not read Weaviate data when the migrated count matches"
+    
+    # Test case 7: Rows lost during the migration are still reported as a mismatch
+    migrator.zilliz_client.get_collection_stats = Mock(return_value={'rowCount': 2})
+    with patch('weaviate_to_zilliz_migrator.logger') as mock_logger:
+        migrator.verify_migration('test_collection', weaviate_count=3, expected=2)
+    assert mock_logger.warning.called, "Should warn when fewer documents were migrated than fetched"
+    
     print("All tests passed!")
 
 